@@ -0,0 +1,29 @@
+"""Replace slots.cafe_id index with composite (cafe_id, start_time).
+
+Revision ID: d3e7a1b5c9f0
+Revises: 5f3a2b1c9c4d
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd3e7a1b5c9f0'
+down_revision = '5f3a2b1c9c4d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_slots_cafe_start',
+        'slots',
+        ['cafe_id', 'start_time'],
+    )
+    op.drop_index('ix_slots_cafe_id', table_name='slots')
+
+
+def downgrade() -> None:
+    op.create_index('ix_slots_cafe_id', 'slots', ['cafe_id'], unique=False)
+    op.drop_index('ix_slots_cafe_start', table_name='slots')
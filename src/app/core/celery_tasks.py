@@ -299,7 +299,6 @@ async def _cleanup_expired_bookings_async() -> int:
     engine = create_async_engine(
         settings.database_url,
         echo=settings.db_echo,
-        future=True,
         poolclass=NullPool,
     )
     async_session_maker = async_sessionmaker(
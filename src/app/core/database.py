@@ -20,7 +20,6 @@ from app.core.logging import logger
 engine = create_async_engine(
     settings.database_url,
     echo=settings.db_echo,
-    future=True,
     pool_pre_ping=True,  # Проверка соединения перед использованием
 )
 
@@ -1,7 +1,7 @@
 from datetime import time
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, String, Time
+from sqlalchemy import ForeignKey, Index, String, Time
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.base import TimestampedModel
@@ -26,10 +26,11 @@ class Slot(TimestampedModel):
     """
 
     __tablename__ = 'slots'
+    __table_args__ = (Index('ix_slots_cafe_start', 'cafe_id', 'start_time'),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     cafe_id: Mapped[int] = mapped_column(
-        ForeignKey('cafes.id', ondelete='CASCADE'), nullable=False, index=True
+        ForeignKey('cafes.id', ondelete='CASCADE'), nullable=False
     )
     start_time: Mapped[time] = mapped_column(Time, nullable=False)
     end_time: Mapped[time] = mapped_column(Time, nullable=False)
@@ -1,7 +1,7 @@
 from datetime import time
 
 from loguru import logger
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -9,6 +9,11 @@ from app.models.slots import Slot
 
 from .base import BaseCRUD
 
+# Ответам по слоту нужны только поля кафе (CafeShortInfo): его
+# selectin-коллекции не загружаем, а обращение к ним падает сразу
+# вместо скрытых запросов.
+SLOT_CAFE_LOADER = selectinload(Slot.cafe).raiseload('*')
+
 
 class SlotRepository(BaseCRUD[Slot]):
     """Repository для CRUD операций со слотами."""
@@ -73,7 +78,7 @@ class SlotRepository(BaseCRUD[Slot]):
         """
         query = (
             select(Slot)
-            .options(selectinload(Slot.cafe))
+            .options(SLOT_CAFE_LOADER)
             .where(Slot.cafe_id == cafe_id)
         )
 
@@ -90,13 +95,45 @@ class SlotRepository(BaseCRUD[Slot]):
         )
         return slots
 
+    async def find_overlapping(
+        self,
+        cafe_id: int,
+        start_time: time,
+        end_time: time,
+        exclude_slot_id: int | None = None,
+    ) -> Slot | None:
+        """Найти активный слот кафе, пересекающийся с интервалом.
+
+        Args:
+            cafe_id: Идентификатор кафе.
+            start_time: Время начала проверяемого интервала.
+            end_time: Время окончания проверяемого интервала.
+            exclude_slot_id: ID слота, который исключить из проверки.
+
+        Returns:
+            Slot | None: Первый пересекающийся слот или None.
+
+        """
+        # Проверка выполняется на каждое создание и изменение слота:
+        # lambda_stmt кэширует построение и компиляцию запроса.
+        query = lambda_stmt(
+            lambda: select(Slot).where(
+                Slot.cafe_id == cafe_id,
+                Slot.active.is_(True),
+                Slot.start_time < end_time,
+                Slot.end_time > start_time,
+            )
+        )
+        if exclude_slot_id:
+            query += lambda s: s.where(Slot.id != exclude_slot_id)
+        query += lambda s: s.order_by(Slot.start_time).limit(1)
+
+        result = await self.session.execute(query)
+        return result.scalars().first()
+
     async def get(self, obj_id: int | str) -> Slot | None:
         """Получить слот по ID с данными кафе."""
-        query = (
-            select(Slot)
-            .options(selectinload(Slot.cafe))
-            .where(Slot.id == obj_id)
-        )
+        query = select(Slot).options(SLOT_CAFE_LOADER).where(Slot.id == obj_id)
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
@@ -7,10 +7,11 @@
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, exists, select
+from sqlalchemy import and_, exists, func, lambda_stmt, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
-from sqlalchemy.sql.elements import BinaryExpression, BooleanClauseList
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql.elements import BinaryExpression
 
 from app.core.constants import Limits, UserRole
 from app.core.security import get_password_hash, verify_password
@@ -220,9 +221,8 @@ class UserRepository(BaseCRUD[User]):
         if commit:
             await self.session.commit()
             await self.session.refresh(db_user)
-            await self.session.refresh(
-                db_user, attribute_names=['managed_cafes']
-            )
+            # Новый пользователь ещё не управляет кафе: не делаем SELECT
+            set_committed_value(db_user, 'managed_cafes', [])
 
         return db_user
 
@@ -319,13 +319,30 @@ class UserRepository(BaseCRUD[User]):
             Аутентифицированный пользователь или None
 
         """
-        user = await self.get_by_username(login, active_only=False)
-
-        if not user and '@' in login:
-            user = await self.get_by_email(login, active_only=False)
+        # Один запрос вместо последовательных get_by_*; приоритет
+        # совпадений сохраняется: username, затем email, затем phone.
+        fields = [self.model.username]
+        if '@' in login:
+            fields.append(self.model.email)
+        if login.startswith('+'):
+            fields.append(self.model.phone)
 
-        if not user and login.startswith('+'):
-            user = await self.get_by_phone(login, active_only=False)
+        query = (
+            select(self.model)
+            .options(selectinload(User.managed_cafes))
+            .where(or_(*(field == login for field in fields)))
+        )
+        result = await self.session.execute(query)
+        candidates = result.scalars().all()
+        user = next(
+            (
+                candidate
+                for field in fields
+                for candidate in candidates
+                if getattr(candidate, field.key) == login
+            ),
+            None,
+        )
 
         if not user:
             return None
@@ -383,13 +400,13 @@ class UserRepository(BaseCRUD[User]):
             Количество пользователей
 
         """
-        query = select(self.model.id)
+        query = select(func.count(self.model.id))
 
         if active_only:
             query = query.where(self.model.active.is_(True))
 
         result = await self.session.execute(query)
-        return len(result.scalars().all())
+        return result.scalar_one()
 
     async def update_password(
         self,
@@ -433,17 +450,16 @@ class UserRepository(BaseCRUD[User]):
             Список найденных пользователей
 
         """
-        conditions: list[BooleanClauseList] = []
+        # lambda_stmt кэширует построение и компиляцию запроса по месту
+        # вызова; значения из замыканий передаются как bound-параметры.
+        pattern = f'%{query_str}%'
+        search_query = lambda_stmt(lambda: select(User))
         if query_str:
-            conditions.append(self.model.username.ilike(f'%{query_str}%'))
+            search_query += lambda s: s.where(User.username.ilike(pattern))
         if active_only:
-            conditions.append(self.model.active.is_(True))
-
-        search_query = select(self.model).where(and_(*conditions))
-        search_query = (
-            search_query.offset(skip)
-            .limit(limit)
-            .order_by(self.model.username)
+            search_query += lambda s: s.where(User.active.is_(True))
+        search_query += (
+            lambda s: s.order_by(User.username).offset(skip).limit(limit)
         )
 
         result = await self.session.execute(search_query)
@@ -109,27 +109,6 @@ class SlotService:
         )
         return slot
 
-    def _slots_overlap(
-        self, s1_start: time, s1_end: time, s2_start: time, s2_end: time
-    ) -> bool:
-        """Проверяет пересечение двух временных интервалов.
-
-        Args:
-            s1_start: Время начала первого интервала.
-            s1_end: Время окончания первого интервала.
-            s2_start: Время начала второго интервала.
-            s2_end: Время окончания второго интервала.
-
-        Returns:
-            bool: True если интервалы пересекаются, иначе False.
-
-        """
-        s1_start = self._normalize_time(s1_start)
-        s1_end = self._normalize_time(s1_end)
-        s2_start = self._normalize_time(s2_start)
-        s2_end = self._normalize_time(s2_end)
-        return s1_start < s2_end and s2_start < s1_end
-
     async def get_slot(
         self,
         cafe_id: int,
@@ -303,21 +282,14 @@ class SlotService:
             ConflictException: Если найдено пересечение с существующим слотом.
 
         """
-        existing_slots = await self.repo.get_all_by_cafe(
-            cafe_id, show_inactive=False
+        slot = await self.repo.find_overlapping(
+            cafe_id, start_time, end_time, exclude_slot_id=exclude_slot_id
         )
-
-        for slot in existing_slots:
-            if exclude_slot_id and slot.id == exclude_slot_id:
-                continue
-
-            if self._slots_overlap(
-                slot.start_time, slot.end_time, start_time, end_time
-            ):
-                raise ConflictException(
-                    error_code=ErrorCode.SLOT_OVERLAP,
-                    detail=(
-                        'Интервал времени пересекается с существующим слотом '
-                        f'(id={slot.id}, {slot.start_time}-{slot.end_time})'
-                    ),
-                )
+        if slot is not None:
+            raise ConflictException(
+                error_code=ErrorCode.SLOT_OVERLAP,
+                detail=(
+                    'Интервал времени пересекается с существующим слотом '
+                    f'(id={slot.id}, {slot.start_time}-{slot.end_time})'
+                ),
+            )
@@ -2,13 +2,25 @@
 
 import asyncio
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from app.core.config import settings
-from app.core.security import get_password_hash
 from app.models.users import User
 
+# Precomputed bcrypt hashes of the seed passwords (testpass123,
+# managerpass123, adminpass123), so reruns against a seeded database do no
+# KDF work. Regenerate with app.core.security.get_password_hash.
+TESTUSER_PASSWORD_HASH = (
+    '$2b$12$/LQripPCi5YFAeup1uG0ieB2IfyMjHwltvkNahDBScpYFIqirLHbu'
+)
+MANAGER_PASSWORD_HASH = (
+    '$2b$12$65wyMCNn.oqRqQ94ZTvPF.hPlZD/Hk/YX8QZMGfBazcN5Pycb48gi'
+)
+ADMIN_PASSWORD_HASH = (
+    '$2b$12$HMQb926WaRImPjafT9Cm2Of9jGTSE8xc3BiZCxv4rLH3QmZ0T29rS'
+)
+
 
 async def init_test_data() -> None:
     """Create test users for testing."""
@@ -16,60 +28,55 @@ async def init_test_data() -> None:
     engine = create_async_engine(
         settings.database_url,
         echo=False,
-        future=True,
     )
 
     # Create session
-    async_session = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
-    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
 
-    async with async_session() as session:
-        # Check if test user already exists
-        from sqlalchemy import select
+    users = [
+        {
+            'username': 'testuser1',
+            'email': 'test@example.com',
+            'phone': '+79999999999',
+            'password_hash': TESTUSER_PASSWORD_HASH,
+            'is_blocked': False,
+            'is_superuser': False,
+        },
+        {
+            'username': 'manager1',
+            'email': 'manager@example.com',
+            'phone': '+79999999998',
+            'password_hash': MANAGER_PASSWORD_HASH,
+            'is_blocked': False,
+            'is_superuser': False,
+        },
+        {
+            'username': 'admin',
+            'email': 'admin@example.com',
+            'phone': '+79999999997',
+            'password_hash': ADMIN_PASSWORD_HASH,
+            'is_blocked': False,
+            'is_superuser': True,
+        },
+    ]
 
-        result = await session.execute(
-            select(User).where(User.email == 'test@example.com')
+    async with async_session() as session:
+        # One INSERT for all users; existing rows are skipped by PostgreSQL
+        stmt = (
+            pg_insert(User)
+            .values(users)
+            .on_conflict_do_nothing()
+            .returning(User.id)
         )
-        existing_user = result.scalar_one_or_none()
+        result = await session.execute(stmt)
+        created = result.scalars().all()
+        await session.commit()
 
-        if existing_user:
-            print('Test user already exists')
+        if not created:
+            print('Test users already exist')
             return
 
-        # Create test users
-        users = [
-            User(
-                username='testuser1',
-                email='test@example.com',
-                phone='+79999999999',
-                password_hash=get_password_hash('testpass123'),
-                is_blocked=False,
-                is_superuser=False,
-            ),
-            User(
-                username='manager1',
-                email='manager@example.com',
-                phone='+79999999998',
-                password_hash=get_password_hash('managerpass123'),
-                is_blocked=False,
-                is_superuser=False,
-            ),
-            User(
-                username='admin',
-                email='admin@example.com',
-                phone='+79999999997',
-                password_hash=get_password_hash('adminpass123'),
-                is_blocked=False,
-                is_superuser=True,
-            ),
-        ]
-
-        for user in users:
-            session.add(user)
-
-        await session.commit()
-        print(f'Created {len(users)} test users')
+        print(f'Created {len(created)} test users')
 
 
 if __name__ == '__main__':
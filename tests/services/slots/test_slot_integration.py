@@ -1,25 +1,65 @@
+from collections.abc import AsyncGenerator, Callable
+from contextlib import AbstractContextManager
 from datetime import time
 from uuid import uuid4
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from app.core.exceptions import ConflictException
 from app.models.cafes import Cafe
+from app.models.slots import Slot
 from app.services.slot import SlotService
 
+pytestmark = pytest.mark.integration
 
-@pytest.fixture
-async def cafe(db_session: AsyncSession) -> Cafe:
-    """Создаёт тестовое кафе в БД."""
-    cafe = Cafe(
-        name=f'Test Cafe {uuid4()}',
-        address='Test Address 1',
-        phone='+79001234567',
-    )
-    db_session.add(cafe)
-    await db_session.flush()
-    return cafe
+# Общие моменты времени для слотов в тестах.
+T09_00 = time(9, 0)
+T09_30 = time(9, 30)
+T10_00 = time(10, 0)
+T10_30 = time(10, 30)
+T11_00 = time(11, 0)
+T12_00 = time(12, 0)
+T13_00 = time(13, 0)
+T14_00 = time(14, 0)
+T15_00 = time(15, 0)
+T16_00 = time(16, 0)
+
+
+@pytest.fixture(scope='module')
+async def cafe(test_engine: AsyncEngine) -> AsyncGenerator[Cafe, None]:
+    """Создаёт тестовое кафе в БД один раз на модуль.
+
+    Кафе коммитится вне db_session, поэтому переживает откат SAVEPOINT
+    каждого теста; слоты тестов откатываются, а кафе удаляется в конце.
+    """
+    async with AsyncSession(test_engine, expire_on_commit=False) as session:
+        cafe = Cafe(
+            name=f'Test Cafe {uuid4()}',
+            address='Test Address 1',
+            phone='+79001234567',
+        )
+        session.add(cafe)
+        await session.commit()
+        yield cafe
+        await session.execute(delete(Cafe).where(Cafe.id == cafe.id))
+        await session.commit()
+
+
+async def _add_slots(
+    session: AsyncSession,
+    cafe: Cafe,
+    intervals: list[tuple[time, time]],
+) -> list[Slot]:
+    """Создаёт слоты напрямую, одним flush, минуя проверки сервиса."""
+    slots = [
+        Slot(cafe_id=cafe.id, start_time=start, end_time=end)
+        for start, end in intervals
+    ]
+    session.add_all(slots)
+    await session.flush()
+    return slots
 
 
 @pytest.fixture
@@ -28,99 +68,235 @@ def slot_service(db_session: AsyncSession) -> SlotService:
     return SlotService(db_session)
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
 async def test_create_slot_integration(
     cafe: Cafe, slot_service: SlotService
 ) -> None:
     """Успешное создание слота в реальной БД."""
     slot = await slot_service.create_slot(
-        cafe_id=cafe.id, start_time=time(9, 0), end_time=time(10, 0)
+        cafe_id=cafe.id, start_time=T09_00, end_time=T10_00
     )
 
     assert slot.cafe_id == cafe.id
-    assert slot.start_time == time(9, 0)
-    assert slot.end_time == time(10, 0)
+    # Сервис приводит время к UTC, колонка хранит время без пояса.
+    assert slot.start_time.replace(tzinfo=None) == T09_00
+    assert slot.end_time.replace(tzinfo=None) == T10_00
     assert slot.active is True
 
-    retrieved_slot = await slot_service.get_slot(slot.id)
-    assert retrieved_slot is not None
+    retrieved_slot = await slot_service.get_slot(cafe.id, slot.id)
     assert retrieved_slot.id == slot.id
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
 async def test_create_slot_with_overlap_raises_error(
     cafe: Cafe, slot_service: SlotService
 ) -> None:
     """Ошибка при попытке создать пересекающийся слот."""
     await slot_service.create_slot(
-        cafe_id=cafe.id, start_time=time(9, 0), end_time=time(10, 0)
+        cafe_id=cafe.id, start_time=T09_00, end_time=T10_00
     )
 
     with pytest.raises(ConflictException):
         await slot_service.create_slot(
-            cafe_id=cafe.id, start_time=time(9, 30), end_time=time(10, 30)
+            cafe_id=cafe.id, start_time=T09_30, end_time=T10_30
         )
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
 async def test_get_cafe_slots_integration(
-    cafe: Cafe, slot_service: SlotService
+    cafe: Cafe, slot_service: SlotService, db_session: AsyncSession
 ) -> None:
     """Получение всех слотов кафе."""
-    await slot_service.create_slot(cafe.id, time(9, 0), time(10, 0))
-    await slot_service.create_slot(cafe.id, time(11, 0), time(12, 0))
+    await _add_slots(
+        db_session,
+        cafe,
+        [(T09_00, T10_00), (T11_00, T12_00)],
+    )
 
     slots = await slot_service.get_cafe_slots(cafe.id)
 
     assert len(slots) == 2
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
 async def test_update_slot_integration(
     cafe: Cafe, slot_service: SlotService
 ) -> None:
     """Обновление времени слота."""
-    slot = await slot_service.create_slot(cafe.id, time(9, 0), time(10, 0))
+    slot = await slot_service.create_slot(cafe.id, T09_00, T10_00)
 
     updated = await slot_service.update_slot(
-        slot.id, cafe.id, start_time=time(14, 0), end_time=time(15, 0)
+        slot.id, cafe.id, start_time=T14_00, end_time=T15_00
     )
 
-    assert updated.start_time == time(14, 0)
-    assert updated.end_time == time(15, 0)
+    assert updated.start_time == T14_00
+    assert updated.end_time == T15_00
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
 async def test_delete_slot_integration(
     cafe: Cafe, slot_service: SlotService
 ) -> None:
     """Деактивация слота."""
-    slot = await slot_service.create_slot(cafe.id, time(9, 0), time(10, 0))
+    slot = await slot_service.create_slot(cafe.id, T09_00, T10_00)
 
     result = await slot_service.delete_slot(slot.id, cafe.id)
 
     assert result is True
 
-    retrieved = await slot_service.get_slot(slot.id)
-    assert retrieved is not None
+    retrieved = await slot_service.get_slot(
+        cafe.id, slot.id, allow_inactive=True
+    )
     assert retrieved.active is False
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
 async def test_update_slot_with_overlap_raises_error(
-    cafe: Cafe, slot_service: SlotService
+    cafe: Cafe, slot_service: SlotService, db_session: AsyncSession
 ) -> None:
     """Ошибка при обновлении слота с пересечением."""
-    await slot_service.create_slot(cafe.id, time(9, 0), time(10, 0))
-    slot2 = await slot_service.create_slot(cafe.id, time(11, 0), time(12, 0))
+    _, slot2 = await _add_slots(
+        db_session,
+        cafe,
+        [(T09_00, T10_00), (T11_00, T12_00)],
+    )
 
     with pytest.raises(ConflictException):
         await slot_service.update_slot(
-            slot2.id, cafe.id, start_time=time(9, 30), end_time=time(10, 30)
+            slot2.id, cafe.id, start_time=T09_30, end_time=T10_30
         )
+
+
+@pytest.mark.parametrize(
+    ('start_time', 'end_time', 'conflict'),
+    [
+        pytest.param(T09_00, T10_00, False, id='adjacent_before'),
+        pytest.param(T11_00, T12_00, False, id='adjacent_after'),
+        pytest.param(T10_00, T10_30, True, id='contained'),
+        pytest.param(T09_00, T12_00, True, id='containing'),
+    ],
+)
+async def test_create_slot_overlap_boundaries(
+    cafe: Cafe,
+    slot_service: SlotService,
+    db_session: AsyncSession,
+    start_time: time,
+    end_time: time,
+    conflict: bool,
+) -> None:
+    """Интервалы полуоткрытые: общая граница не считается пересечением."""
+    await _add_slots(db_session, cafe, [(T10_00, T11_00)])
+
+    if conflict:
+        with pytest.raises(ConflictException):
+            await slot_service.create_slot(cafe.id, start_time, end_time)
+    else:
+        slot = await slot_service.create_slot(cafe.id, start_time, end_time)
+        assert slot.cafe_id == cafe.id
+
+
+async def test_update_slot_overlapping_own_interval(
+    cafe: Cafe, slot_service: SlotService, db_session: AsyncSession
+) -> None:
+    """Сдвиг слота внутрь его прежнего времени не даёт конфликта."""
+    slot, _ = await _add_slots(
+        db_session,
+        cafe,
+        [(T09_00, T10_00), (T11_00, T12_00)],
+    )
+
+    updated = await slot_service.update_slot(
+        slot.id, cafe.id, start_time=T09_30, end_time=T10_30
+    )
+
+    assert updated.id == slot.id
+    assert updated.start_time == T09_30
+    assert updated.end_time == T10_30
+
+
+async def test_create_slot_over_inactive_slot(
+    cafe: Cafe, slot_service: SlotService, db_session: AsyncSession
+) -> None:
+    """Неактивный слот не участвует в проверке пересечений."""
+    (inactive,) = await _add_slots(db_session, cafe, [(T09_00, T10_00)])
+    inactive.active = False
+    await db_session.flush()
+
+    slot = await slot_service.create_slot(cafe.id, T09_00, T10_00)
+
+    assert slot.id != inactive.id
+    assert slot.active is True
+
+
+# Границы ниже равны числу операторов, которое ORM выдаёт для этих
+# вызовов, и от бэкенда не зависят: SQLite и PostgreSQL получают одни и те
+# же SELECT, INSERT ... RETURNING и UPDATE. SAVEPOINT теста открывается
+# ещё при _add_slots, а служебные запросы asyncpg при подключении
+# выполняются до входа в count_queries. Любой лишний запрос роняет тест.
+
+
+async def test_get_cafe_slots_query_count(
+    cafe: Cafe,
+    slot_service: SlotService,
+    db_session: AsyncSession,
+    count_queries: Callable[[AsyncSession], AbstractContextManager[list[str]]],
+) -> None:
+    """Число запросов не зависит от количества слотов."""
+    await _add_slots(
+        db_session,
+        cafe,
+        [
+            (T09_00, T10_00),
+            (T11_00, T12_00),
+            (T13_00, T14_00),
+        ],
+    )
+
+    with count_queries(db_session) as statements:
+        slots = await slot_service.get_cafe_slots(cafe.id)
+
+    assert len(slots) == 3
+    # Кафе и его selectin-коллекции, затем слоты и их кафе одним IN.
+    assert len(statements) <= 6
+
+
+async def test_create_slot_query_count(
+    cafe: Cafe,
+    slot_service: SlotService,
+    db_session: AsyncSession,
+    count_queries: Callable[[AsyncSession], AbstractContextManager[list[str]]],
+) -> None:
+    """Проверка пересечений при создании не растёт со слотами кафе."""
+    await _add_slots(
+        db_session,
+        cafe,
+        [
+            (T09_00, T10_00),
+            (T11_00, T12_00),
+            (T13_00, T14_00),
+        ],
+    )
+
+    with count_queries(db_session) as statements:
+        await slot_service.create_slot(cafe.id, T15_00, T16_00)
+
+    assert len(statements) <= 8
+
+
+async def test_update_slot_query_count(
+    cafe: Cafe,
+    slot_service: SlotService,
+    db_session: AsyncSession,
+    count_queries: Callable[[AsyncSession], AbstractContextManager[list[str]]],
+) -> None:
+    """Проверка пересечений при обновлении не растёт со слотами кафе."""
+    slot, *_ = await _add_slots(
+        db_session,
+        cafe,
+        [
+            (T09_00, T10_00),
+            (T11_00, T12_00),
+            (T13_00, T14_00),
+        ],
+    )
+
+    with count_queries(db_session) as statements:
+        await slot_service.update_slot(
+            slot.id, cafe.id, start_time=T15_00, end_time=T16_00
+        )
+
+    assert len(statements) <= 6
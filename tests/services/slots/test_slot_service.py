@@ -1,70 +1,63 @@
 # tests/services/slots/test_slot_service.py
 """Unit-тесты для SlotService."""
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from datetime import time
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from app.core.exceptions import ConflictException, ValidationException
+from app.core.constants import ErrorCode
+from app.core.exceptions import (
+    ConflictException,
+    NotFoundException,
+    ValidationException,
+)
 from app.services.slot import SlotService
 
+pytestmark = pytest.mark.unit
 
-class TestSlotsOverlap:
-    """Тесты проверки пересечения временных интервалов."""
+# Общие моменты времени для слотов в тестах.
+T09_00 = time(9, 0)
+T10_00 = time(10, 0)
+T11_00 = time(11, 0)
+T12_00 = time(12, 0)
 
-    @pytest.mark.unit
-    def test_slots_overlap_true(self) -> None:
-        """Интервалы пересекаются: 9:00-10:00 и 9:30-10:30."""
-        service = SlotService(session=None)
 
-        result = service._slots_overlap(
-            time(9, 0), time(10, 0), time(9, 30), time(10, 30)
-        )
-
-        assert result is True
-
-    @pytest.mark.unit
-    def test_slots_no_overlap_after(self) -> None:
-        """Интервалы НЕ пересекаются: 9:00-10:00 и 10:00-11:00."""
-        service = SlotService(session=None)
-
-        result = service._slots_overlap(
-            time(9, 0), time(10, 0), time(10, 0), time(11, 0)
-        )
+def _async_return(value: object) -> Callable[..., Awaitable[object]]:
+    """Заглушка async-метода, всегда возвращающая value.
 
-        assert result is False
+    Дешевле AsyncMock там, где вызовы не проверяются.
+    """
 
-    @pytest.mark.unit
-    def test_slots_no_overlap_before(self) -> None:
-        """Интервалы НЕ пересекаются: 10:00-11:00 и 9:00-10:00."""
-        service = SlotService(session=None)
+    async def _stub(*_args: object, **_kwargs: object) -> object:
+        return value
 
-        result = service._slots_overlap(
-            time(10, 0), time(11, 0), time(9, 0), time(10, 0)
-        )
-
-        assert result is False
-
-    @pytest.mark.unit
-    def test_slots_overlap_contained(self) -> None:
-        """Один интервал внутри другого: 8:00-12:00 и 9:00-10:00."""
-        service = SlotService(session=None)
+    return _stub
 
-        result = service._slots_overlap(
-            time(8, 0), time(12, 0), time(9, 0), time(10, 0)
-        )
 
-        assert result is True
+@pytest.fixture
+def mocked_slot_service() -> SlotService:
+    """SlotService с мок-сессией и мок-репозиторием."""
+    service = SlotService(AsyncMock())
+    service.repo = AsyncMock()
+    return service
 
 
 class TestCreateSlot:
     """Тесты создания слота."""
 
-    @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_create_slot_invalid_time_range(self) -> None:
+    @pytest.mark.parametrize(
+        ('start_time', 'end_time'),
+        [
+            pytest.param(T10_00, T09_00, id='start_after_end'),
+            pytest.param(T10_00, T10_00, id='equal_times'),
+        ],
+    )
+    async def test_create_slot_invalid_time_range(
+        self, start_time: time, end_time: time
+    ) -> None:
         """Ошибка если start_time >= end_time."""
         session = AsyncMock()
         service = SlotService(session)
@@ -73,74 +66,59 @@ class TestCreateSlot:
 
         with pytest.raises(ValidationException) as exc:
             await service.create_slot(
-                cafe_id=1, start_time=time(10, 0), end_time=time(9, 0)
+                cafe_id=1, start_time=start_time, end_time=end_time
             )
         service._validate_cafe_exists.assert_called_once_with(1)
 
         assert 'Время начала должно быть раньше' in str(exc.value.detail)
 
-    @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_create_slot_equal_times(self) -> None:
-        """Ошибка если start_time == end_time."""
-        session = AsyncMock()
-        service = SlotService(session)
-
-        service._validate_cafe_exists = AsyncMock()
-
-        with pytest.raises(ValidationException):
-            await service.create_slot(
-                cafe_id=1, start_time=time(10, 0), end_time=time(10, 0)
-            )
-
 
 class TestGetSlot:
     """Тесты получения слота."""
 
-    @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_get_slot_success(
-        self, mock_slot_factory: Callable[..., MagicMock]
+        self,
+        mocked_slot_service: SlotService,
+        mock_slot_factory: Callable[..., SimpleNamespace],
     ) -> None:
         """Успешное получение слота по ID."""
-        session = AsyncMock()
-        service = SlotService(session)
-        service.repo = AsyncMock()
+        service = mocked_slot_service
+        service._get_cafe = AsyncMock()
         mock_slot = mock_slot_factory(id_=1, cafe_id=1)
 
         service.repo.get = AsyncMock(return_value=mock_slot)
 
-        result = await service.get_slot(1)
+        result = await service.get_slot(cafe_id=1, slot_id=1)
 
         assert result.id == 1
         assert result.cafe_id == 1
+        service._get_cafe.assert_called_once_with(1, allow_inactive=False)
         service.repo.get.assert_called_once_with(1)
 
-    @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_get_slot_not_found(self) -> None:
-        """Слот не найден - возвращает None."""
-        session = AsyncMock()
-        service = SlotService(session)
-        service.repo = AsyncMock()
-        service.repo.get = AsyncMock(return_value=None)
+    async def test_get_slot_not_found(
+        self, mocked_slot_service: SlotService
+    ) -> None:
+        """Слот не найден - NotFoundException."""
+        service = mocked_slot_service
+        service._get_cafe = _async_return(None)
+        service.repo.get = _async_return(None)
+
+        with pytest.raises(NotFoundException) as exc:
+            await service.get_slot(cafe_id=1, slot_id=999)
 
-        result = await service.get_slot(999)
-        assert result is None
+        assert exc.value.error_code == ErrorCode.SLOT_NOT_FOUND
 
 
 class TestDeleteSlot:
     """Тесты удаления слота."""
 
-    @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_delete_slot_success(
-        self, mock_slot_factory: Callable[..., MagicMock]
+        self,
+        mocked_slot_service: SlotService,
+        mock_slot_factory: Callable[..., SimpleNamespace],
     ) -> None:
         """Успешное удаление (деактивация) слота."""
-        session = AsyncMock()
-        service = SlotService(session)
-        service.repo = AsyncMock()
+        service = mocked_slot_service
 
         mock_slot = mock_slot_factory(id_=1, cafe_id=1, active=True)
         service.repo.get = AsyncMock(return_value=mock_slot)
@@ -151,203 +129,183 @@ class TestDeleteSlot:
         assert mock_slot.active is False
         service.repo.get.assert_called_once_with(1)
 
-    @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_delete_slot_not_found(self) -> None:
-        """Слот не найден - возвращает False."""
-        session = AsyncMock()
-        service = SlotService(session)
-        service.repo = AsyncMock()
-        service.repo.get = AsyncMock(return_value=None)
+    async def test_delete_slot_not_found(
+        self, mocked_slot_service: SlotService
+    ) -> None:
+        """Слот не найден - NotFoundException."""
+        service = mocked_slot_service
+        service.repo.get = _async_return(None)
+
+        with pytest.raises(NotFoundException) as exc:
+            await service.delete_slot(slot_id=999, cafe_id=1)
 
-        result = await service.delete_slot(slot_id=999, cafe_id=1)
-        assert result is False
+        assert exc.value.error_code == ErrorCode.SLOT_NOT_FOUND
 
-    @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_delete_slot_wrong_cafe(
-        self, mock_slot_factory: Callable[..., MagicMock]
+        self,
+        mocked_slot_service: SlotService,
+        mock_slot_factory: Callable[..., SimpleNamespace],
     ) -> None:
-        """Слот принадлежит другому кафе - возвращает False."""
-        session = AsyncMock()
-        service = SlotService(session)
-        service.repo = AsyncMock()
+        """Слот принадлежит другому кафе - NotFoundException."""
+        service = mocked_slot_service
         mock_slot = mock_slot_factory(id_=1, cafe_id=999)
 
-        service.repo.get = AsyncMock(return_value=mock_slot)
+        service.repo.get = _async_return(mock_slot)
 
-        result = await service.delete_slot(slot_id=1, cafe_id=1)
-        assert result is False
+        with pytest.raises(NotFoundException):
+            await service.delete_slot(slot_id=1, cafe_id=1)
+
+        assert mock_slot.active is True
 
 
 class TestValidateSlotOverlap:
     """Тесты проверки пересечения с существующими слотами."""
 
-    @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_validate_no_overlap(self) -> None:
+    async def test_validate_no_overlap(
+        self, mocked_slot_service: SlotService
+    ) -> None:
         """Нет пересечений - валидация проходит."""
-        session = AsyncMock()
-        service = SlotService(session)
-        service.repo = AsyncMock()
-
-        existing_slot = MagicMock()
-        existing_slot.id = 1
-        existing_slot.start_time = time(9, 0)
-        existing_slot.end_time = time(10, 0)
-
-        service.repo.get_all_by_cafe = AsyncMock(return_value=[existing_slot])
+        service = mocked_slot_service
+        service.repo.find_overlapping = AsyncMock(return_value=None)
 
         await service._validate_slot_overlap(
-            cafe_id=1, start_time=time(10, 0), end_time=time(11, 0)
+            cafe_id=1, start_time=T10_00, end_time=T11_00
         )
 
-    @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_validate_overlap_raises_exception(self) -> None:
+        service.repo.find_overlapping.assert_called_once_with(
+            1, T10_00, T11_00, exclude_slot_id=None
+        )
+
+    async def test_validate_overlap_raises_exception(
+        self, mocked_slot_service: SlotService
+    ) -> None:
         """Есть пересечение - выбрасывается ConflictException."""
-        session = AsyncMock()
-        service = SlotService(session)
-        service.repo = AsyncMock()
+        service = mocked_slot_service
 
         existing_slot = MagicMock()
         existing_slot.id = 1
-        existing_slot.start_time = time(9, 0)
-        existing_slot.end_time = time(11, 0)
+        existing_slot.start_time = T09_00
+        existing_slot.end_time = T11_00
 
-        service.repo.get_all_by_cafe = AsyncMock(return_value=[existing_slot])
+        service.repo.find_overlapping = _async_return(existing_slot)
 
         with pytest.raises(ConflictException) as exc:
             await service._validate_slot_overlap(
-                cafe_id=1, start_time=time(10, 0), end_time=time(12, 0)
+                cafe_id=1, start_time=T10_00, end_time=T12_00
             )
 
         assert 'пересекается' in str(exc.value.detail).lower()
 
-    @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_validate_overlap_exclude_slot(self) -> None:
-        """Исключение слота из проверки работает корректно."""
-        session = AsyncMock()
-        service = SlotService(session)
-        service.repo = AsyncMock()
-
-        existing_slot = MagicMock()
-        existing_slot.id = 5
-        existing_slot.start_time = time(9, 0)
-        existing_slot.end_time = time(11, 0)
-
-        service.repo.get_all_by_cafe = AsyncMock(return_value=[existing_slot])
+    async def test_validate_overlap_exclude_slot(
+        self, mocked_slot_service: SlotService
+    ) -> None:
+        """Исключаемый слот передаётся в запрос пересечений."""
+        service = mocked_slot_service
+        service.repo.find_overlapping = AsyncMock(return_value=None)
 
         await service._validate_slot_overlap(
             cafe_id=1,
-            start_time=time(9, 0),
-            end_time=time(11, 0),
+            start_time=T09_00,
+            end_time=T11_00,
             exclude_slot_id=5,
         )
 
+        service.repo.find_overlapping.assert_called_once_with(
+            1, T09_00, T11_00, exclude_slot_id=5
+        )
+
 
 class TestUpdateSlot:
     """Тесты обновления слота."""
 
-    @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_update_slot_time_success(
-        self, mock_slot_factory: Callable[..., MagicMock]
+        self,
+        mocked_slot_service: SlotService,
+        mock_slot_factory: Callable[..., SimpleNamespace],
     ) -> None:
         """Успешное обновление времени слота."""
-        session = AsyncMock()
-        service = SlotService(session)
-        service.repo = AsyncMock()
+        service = mocked_slot_service
 
         mock_slot = mock_slot_factory(
-            id_=1, cafe_id=1, start=time(9, 0), end=time(10, 0), active=True
+            id_=1, cafe_id=1, start=T09_00, end=T10_00, active=True
         )
-        service.repo.get = AsyncMock(return_value=mock_slot)
+        service.repo.get = _async_return(mock_slot)
         service._validate_slot_overlap = AsyncMock()
 
         result = await service.update_slot(
-            slot_id=1, cafe_id=1, start_time=time(10, 0), end_time=time(11, 0)
+            slot_id=1, cafe_id=1, start_time=T10_00, end_time=T11_00
         )
 
         assert result is not None
-        assert mock_slot.start_time == time(10, 0)
-        assert mock_slot.end_time == time(11, 0)
+        assert mock_slot.start_time == T10_00
+        assert mock_slot.end_time == T11_00
         service._validate_slot_overlap.assert_called_once()
 
-    @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_update_slot_invalid_time(
-        self, mock_slot_factory: Callable[..., MagicMock]
+        self,
+        mocked_slot_service: SlotService,
+        mock_slot_factory: Callable[..., SimpleNamespace],
     ) -> None:
         """Ошибка при обновлении с неправильным временем."""
-        session = AsyncMock()
-        service = SlotService(session)
-        service.repo = AsyncMock()
+        service = mocked_slot_service
         mock_slot = mock_slot_factory(
-            id_=1, cafe_id=1, start=time(9, 0), end=time(10, 0)
+            id_=1, cafe_id=1, start=T09_00, end=T10_00
         )
 
-        service.repo.get = AsyncMock(return_value=mock_slot)
+        service.repo.get = _async_return(mock_slot)
 
         with pytest.raises(ValidationException):
             await service.update_slot(
                 slot_id=1,
                 cafe_id=1,
-                start_time=time(11, 0),
-                end_time=time(10, 0),
+                start_time=T11_00,
+                end_time=T10_00,
             )
 
-    @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_update_slot_wrong_cafe(self) -> None:
+    async def test_update_slot_wrong_cafe(
+        self, mocked_slot_service: SlotService
+    ) -> None:
         """Ошибка при обновлении слота другого кафе."""
-        session = AsyncMock()
-        service = SlotService(session)
-        service.repo = AsyncMock()
+        service = mocked_slot_service
 
         mock_slot = MagicMock()
         mock_slot.id = 1
         mock_slot.cafe_id = 999
 
-        service.repo.get = AsyncMock(return_value=mock_slot)
-
-        result = await service.update_slot(
-            slot_id=1, cafe_id=1, start_time=time(10, 0), end_time=time(11, 0)
-        )
+        service.repo.get = _async_return(mock_slot)
 
-        assert result is None  # Должен вернуть None
+        with pytest.raises(NotFoundException):
+            await service.update_slot(
+                slot_id=1, cafe_id=1, start_time=T10_00, end_time=T11_00
+            )
 
-    @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_update_slot_not_found(self) -> None:
+    async def test_update_slot_not_found(
+        self, mocked_slot_service: SlotService
+    ) -> None:
         """Ошибка при обновлении несуществующего слота."""
-        session = AsyncMock()
-        service = SlotService(session)
-        service.repo = AsyncMock()
-        service.repo.get = AsyncMock(return_value=None)
+        service = mocked_slot_service
+        service.repo.get = _async_return(None)
 
-        result = await service.update_slot(
-            slot_id=999,
-            cafe_id=1,
-            start_time=time(10, 0),
-            end_time=time(11, 0),
-        )
+        with pytest.raises(NotFoundException) as exc:
+            await service.update_slot(
+                slot_id=999,
+                cafe_id=1,
+                start_time=T10_00,
+                end_time=T11_00,
+            )
 
-        assert result is None
+        assert exc.value.error_code == ErrorCode.SLOT_NOT_FOUND
 
-    @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_update_slot_active_status(
-        self, mock_slot_factory: Callable[..., MagicMock]
+        self,
+        mocked_slot_service: SlotService,
+        mock_slot_factory: Callable[..., SimpleNamespace],
     ) -> None:
         """Обновление статуса активности слота."""
-        session = AsyncMock()
-        service = SlotService(session)
-        service.repo = AsyncMock()
+        service = mocked_slot_service
 
         mock_slot = mock_slot_factory(id_=1, cafe_id=1, active=True)
-        service.repo.get = AsyncMock(return_value=mock_slot)
+        service.repo.get = _async_return(mock_slot)
 
         result = await service.update_slot(slot_id=1, cafe_id=1, active=False)
 
@@ -358,34 +316,30 @@ class TestUpdateSlot:
 class TestGetCafeSlots:
     """Тесты получения списка слотов кафе."""
 
-    @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_get_cafe_slots_only_active(self) -> None:
-        """Получение только активных слотов."""
-        session = AsyncMock()
-        service = SlotService(session)
-        service.repo = AsyncMock()
-
-        mock_slots = [MagicMock(id=1), MagicMock(id=2)]
-        service.repo.get_all_by_cafe = AsyncMock(return_value=mock_slots)
-
-        result = await service.get_cafe_slots(cafe_id=1, show_inactive=False)
-
-        assert len(result) == 2
-        service.repo.get_all_by_cafe.assert_called_once_with(1, False)
-
-    @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_get_cafe_slots_with_inactive(self) -> None:
-        """Получение всех слотов включая неактивные."""
-        session = AsyncMock()
-        service = SlotService(session)
-        service.repo = AsyncMock()
+    @pytest.mark.parametrize(
+        ('show_inactive', 'slot_ids'),
+        [
+            pytest.param(False, [1, 2], id='only_active'),
+            pytest.param(True, [1, 2, 3], id='with_inactive'),
+        ],
+    )
+    async def test_get_cafe_slots(
+        self,
+        mocked_slot_service: SlotService,
+        show_inactive: bool,
+        slot_ids: list[int],
+    ) -> None:
+        """Получение слотов с учётом флага show_inactive."""
+        service = mocked_slot_service
+        service._get_cafe = AsyncMock()
 
-        mock_slots = [MagicMock(id=1), MagicMock(id=2), MagicMock(id=3)]
+        mock_slots = [MagicMock(id=slot_id) for slot_id in slot_ids]
         service.repo.get_all_by_cafe = AsyncMock(return_value=mock_slots)
 
-        result = await service.get_cafe_slots(cafe_id=1, show_inactive=True)
+        result = await service.get_cafe_slots(
+            cafe_id=1, show_inactive=show_inactive
+        )
 
-        assert len(result) == 3
-        service.repo.get_all_by_cafe.assert_called_once_with(1, True)
+        assert len(result) == len(slot_ids)
+        service._get_cafe.assert_called_once_with(1, allow_inactive=False)
+        service.repo.get_all_by_cafe.assert_called_once_with(1, show_inactive)